@@ -501,30 +501,18 @@ def build_request(
     length = len(payload) + 4
     buf = bytearray(length + 4)
 
-    checksum = int(equipment) + length + int(command)
-
     # Fixed header prefix used by iFit equipment.
-    pos = 0
-    buf[pos] = 2
-    pos += 1
-    buf[pos] = 4
-    pos += 1
-    buf[pos] = 2
-    pos += 1
-    buf[pos] = length
-    pos += 1
-    buf[pos] = int(equipment)
-    pos += 1
-    buf[pos] = length
-    pos += 1
-    buf[pos] = int(command)
-    pos += 1
-    for byte in payload:
-        checksum += byte
-        buf[pos] = byte
-        pos += 1
-    # Checksum is the low byte of the sum of header fields and payload bytes.
-    buf[pos] = checksum & 0xFF
+    buf[0] = 2
+    buf[1] = 4
+    buf[2] = 2
+    buf[3] = length
+    buf[4] = int(equipment)
+    buf[5] = length
+    buf[6] = int(command)
+    buf[7 : 7 + len(payload)] = payload
+    # Checksum is the low byte of the sum of header fields and payload bytes;
+    # sum() iterates the payload in C instead of a per-byte Python loop.
+    buf[-1] = (int(equipment) + length + int(command) + sum(payload)) & 0xFF
     return bytes(buf)
 
 
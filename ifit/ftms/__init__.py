@@ -6,6 +6,7 @@ from ._ftms import (
     FitnessMachineStatus,
     FtmsRanges,
     encode_control_point_response,
+    encode_control_point_response_into,
     encode_fitness_machine_feature,
     encode_status_safety_key,
     encode_status_started,
@@ -15,6 +16,7 @@ from ._ftms import (
     encode_supported_incline_range,
     encode_supported_speed_range,
     encode_treadmill_data,
+    encode_treadmill_data_into,
 )
 from ._server import FtmsBleRelay, FtmsConfig
 
@@ -26,6 +28,7 @@ __all__ = [
     "FtmsConfig",
     "FtmsRanges",
     "encode_control_point_response",
+    "encode_control_point_response_into",
     "encode_fitness_machine_feature",
     "encode_status_safety_key",
     "encode_status_started",
@@ -35,4 +38,5 @@ __all__ = [
     "encode_supported_incline_range",
     "encode_supported_speed_range",
     "encode_treadmill_data",
+    "encode_treadmill_data_into",
 ]
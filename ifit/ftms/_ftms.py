@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import math
 from enum import IntEnum
-from struct import pack
+from struct import Struct, pack
 
 from pydantic import BaseModel, Field, model_validator
 
@@ -45,12 +45,24 @@ SUPPORTED_INCLINE_RANGE_UUID = bt16(0x2AD5)
 # GAP Appearance value for treadmill (Generic Running Walking Sensor)
 APPEARANCE_TREADMILL = 0x0480
 
+# Precompiled layouts for the per-notification treadmill data encoder
+_FLAGS_SPEED_STRUCT = Struct("<HH")
+_INCLINE_STRUCT = Struct("<hh")
+_U16_STRUCT = Struct("<H")
+_CP_RESPONSE_STRUCT = Struct("<BBB")
+
+# Control point responses are always three bytes
+CONTROL_POINT_RESPONSE_LEN = _CP_RESPONSE_STRUCT.size
+
 # FTMS Treadmill Data flags (bits indicate which optional fields are present)
 TREADMILL_FLAG_MORE_DATA = 0x0001  # Bit 0: More Data (1 if fragmented, 0 if complete)
 TREADMILL_FLAG_DISTANCE = 0x0004  # Bit 2: Total Distance Present
 TREADMILL_FLAG_INCLINE = 0x0008  # Bit 3: Inclination and Ramp Angle Setting Present
 TREADMILL_FLAG_HEART_RATE = 0x0100  # Bit 8: Heart Rate Present
 
+# Largest treadmill data payload we emit: flags + speed + distance + incline + hr
+TREADMILL_DATA_MAX_LEN = 12
+
 
 class ControlPointOpcode(IntEnum):
     """Fitness Machine Control Point opcodes used by the relay."""
@@ -162,14 +174,19 @@ def _s16_or_unknown(value: float | None, scale: float, unknown: int) -> int:
     return max(-32768, min(raw, 32767))
 
 
-def encode_treadmill_data(
+def encode_treadmill_data_into(
+    buf: bytearray,
     *,
     speed_kph: float | None,
     incline_percent: float | None,
     distance_m: float | None,
     heart_rate_bpm: int | None,
-) -> bytearray:
-    """Encode treadmill data with optional incline, distance, and heart rate.
+) -> int:
+    """Encode treadmill data into ``buf`` and return the number of bytes written.
+
+    ``buf`` must be at least TREADMILL_DATA_MAX_LEN long; packing in place
+    lets callers reuse one buffer across notifications instead of allocating
+    a payload per tick.
 
     Field order per FTMS spec:
     1. Flags (uint16)
@@ -193,38 +210,59 @@ def encode_treadmill_data(
     # More Data bit would be 1 only if we needed to fragment across multiple notifications
 
     speed_raw = _u16_or_unknown(speed_kph, 100.0, 0xFFFF)
-    payload = bytearray(pack("<H", flags))
-    payload += pack("<H", speed_raw)
+    _FLAGS_SPEED_STRUCT.pack_into(buf, 0, flags, speed_raw)
+    offset = 4
 
     # Note: Average Speed (bit 1) not implemented - skip to Distance
 
     if distance_m is not None:
         flags |= TREADMILL_FLAG_DISTANCE
         distance_raw = max(0, min(round(distance_m), 0xFFFFFF))
-        payload += distance_raw.to_bytes(3, "little")
+        buf[offset : offset + 3] = distance_raw.to_bytes(3, "little")
+        offset += 3
 
     if incline_percent is not None:
         flags |= TREADMILL_FLAG_INCLINE
         # Per FTMS spec, when bit 3 is set, BOTH inclination and ramp angle must be present:
         # Field 5: Inclination in units of 0.1% (percentage)
         incline_percent_raw = _s16_or_unknown(incline_percent, 10.0, 0x7FFF)
-        payload += pack("<h", incline_percent_raw)
         # Field 6: Ramp Angle Setting in units of 0.1 degrees
         # Convert from percentage to degrees: degrees = atan(percent / 100) * 180 / π
         incline_degrees = math.degrees(math.atan(incline_percent / 100.0))
         incline_degrees_raw = _s16_or_unknown(incline_degrees, 10.0, 0x7FFF)
-        payload += pack("<h", incline_degrees_raw)
+        _INCLINE_STRUCT.pack_into(buf, offset, incline_percent_raw, incline_degrees_raw)
+        offset += 4
 
     # Note: Elevation Gain (bit 4), Pace fields (bits 5-6), Energy (bit 7) not implemented
 
     if heart_rate_bpm is not None:
         flags |= TREADMILL_FLAG_HEART_RATE
-        hr_raw = max(0, min(int(heart_rate_bpm), 0xFF))
-        payload += pack("<B", hr_raw)
+        buf[offset] = max(0, min(int(heart_rate_bpm), 0xFF))
+        offset += 1
 
-    # Update flags at the beginning of payload
-    payload[0:2] = pack("<H", flags)
-    return payload
+    # Update flags at the beginning of the payload
+    _U16_STRUCT.pack_into(buf, 0, flags)
+    return offset
+
+
+def encode_treadmill_data(
+    *,
+    speed_kph: float | None,
+    incline_percent: float | None,
+    distance_m: float | None,
+    heart_rate_bpm: int | None,
+) -> bytearray:
+    """Encode treadmill data into a fresh buffer, trimmed to the used length."""
+    buf = bytearray(TREADMILL_DATA_MAX_LEN)
+    n = encode_treadmill_data_into(
+        buf,
+        speed_kph=speed_kph,
+        incline_percent=incline_percent,
+        distance_m=distance_m,
+        heart_rate_bpm=heart_rate_bpm,
+    )
+    del buf[n:]
+    return buf
 
 
 def encode_control_point_response(
@@ -232,12 +270,27 @@ def encode_control_point_response(
     result: ControlPointResult,
 ) -> bytes:
     """Encode an FTMS Control Point response."""
-    return pack(
-        "<BBB",
+    return _CP_RESPONSE_STRUCT.pack(
+        ControlPointOpcode.RESPONSE_CODE,
+        request_opcode & 0xFF,
+        int(result) & 0xFF,
+    )
+
+
+def encode_control_point_response_into(
+    buf: bytearray,
+    request_opcode: int,
+    result: ControlPointResult,
+) -> int:
+    """Encode an FTMS Control Point response into ``buf``, returning the length."""
+    _CP_RESPONSE_STRUCT.pack_into(
+        buf,
+        0,
         ControlPointOpcode.RESPONSE_CODE,
         request_opcode & 0xFF,
         int(result) & 0xFF,
     )
+    return CONTROL_POINT_RESPONSE_LEN
 
 
 def encode_status_started() -> bytes:
@@ -5,9 +5,10 @@ import contextlib
 import logging
 import sys
 from collections.abc import Callable, Coroutine
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from struct import unpack
-from typing import Self, TypeAlias
+from struct import Struct
+from typing import Any, Self
 
 from bless import (
     BlessGATTCharacteristic,
@@ -15,6 +16,10 @@ from bless import (
     GATTAttributePermissions,
     GATTCharacteristicProperties,
 )
+
+# BlessServer.get_characteristic returns the backend-agnostic base class,
+# not the platform alias bless exports at top level.
+from bless.backends.characteristic import BlessGATTCharacteristic as BaseGATTCharacteristic
 from pydantic import BaseModel, Field
 
 from ..client import IFitBleClient
@@ -22,6 +27,7 @@ from ..client.protocol import Mode
 from ._ftms import (
     APPEARANCE_TREADMILL,
     APPEARANCE_UUID,
+    CONTROL_POINT_RESPONSE_LEN,
     DEVICE_INFORMATION_SERVICE_UUID,
     DEVICE_NAME_UUID,
     FIRMWARE_REVISION_UUID,
@@ -39,11 +45,12 @@ from ._ftms import (
     SOFTWARE_REVISION_UUID,
     SUPPORTED_INCLINE_RANGE_UUID,
     SUPPORTED_SPEED_RANGE_UUID,
+    TREADMILL_DATA_MAX_LEN,
     TREADMILL_DATA_UUID,
     ControlPointOpcode,
     ControlPointResult,
     FtmsRanges,
-    encode_control_point_response,
+    encode_control_point_response_into,
     encode_fitness_machine_feature,
     encode_status_safety_key,
     encode_status_started,
@@ -52,15 +59,11 @@ from ._ftms import (
     encode_status_target_speed_changed,
     encode_supported_incline_range,
     encode_supported_speed_range,
-    encode_treadmill_data,
+    encode_treadmill_data_into,
 )
 
 LOGGER = logging.getLogger(__name__)
 
-# Type aliases for clarity
-CharacteristicUUID: TypeAlias = str
-ServiceUUID: TypeAlias = str
-
 # Control point message length constants
 CONTROL_POINT_MIN_LENGTH = 1  # Minimum opcode byte
 TARGET_VALUE_LENGTH = 3  # Opcode + 2-byte value
@@ -72,6 +75,66 @@ FTMS_UNKNOWN_SINT16 = 0x7FFF
 # Target value change detection threshold
 TARGET_CHANGE_THRESHOLD = 0.01  # Minimum change to trigger status notification
 
+# GAP appearance payload, a compile-time constant
+_APPEARANCE_VALUE = APPEARANCE_TREADMILL.to_bytes(2, "little")
+
+# FTMS feature bitfield advertised by the relay; identical for every
+# instance, so encoded once at import
+_FEATURE_VALUE = encode_fitness_machine_feature(
+    supports_inclination=True,
+    supports_heart_rate=True,
+    supports_total_distance=True,
+    supports_speed_target=True,
+    supports_incline_target=True,
+)
+
+# Pre-encoded FTMS status payloads keyed by iFit mode, computed once at import
+_STATUS_STARTED = encode_status_started()
+_STATUS_STOPPED = encode_status_stopped()
+# Encoded payloads for the default ranges, shared by relays constructed
+# without equipment-specific overrides.
+_DEFAULT_RANGES = FtmsRanges()
+_DEFAULT_SPEED_RANGE = encode_supported_speed_range(_DEFAULT_RANGES)
+_DEFAULT_INCLINE_RANGE = encode_supported_incline_range(_DEFAULT_RANGES)
+
+# Precompiled parsers for control point target parameters; Struct.unpack_from
+# skips the per-call format parse and the value[1:3] slice allocation.
+_U16_LE = Struct("<H")
+_S16_LE = Struct("<h")
+
+# Wake-ups landing this close after a periodic push are coalesced into it
+# instead of triggering a redundant notification burst.
+_NOTIFY_COALESCE_WINDOW = 0.05
+
+
+class _LazyHex:
+    """Defers value.hex() until a log record is actually formatted."""
+
+    __slots__ = ("_value",)
+
+    def __init__(self, value: bytes | bytearray) -> None:
+        self._value = value
+
+    def __str__(self) -> str:
+        return self._value.hex()
+
+
+def _log_update_failure(future: Future[None]) -> None:
+    """Log update_value failures surfaced on the notify worker thread."""
+    exc = future.exception()
+    if exc:
+        LOGGER.error("Characteristic update failed: %s", exc, exc_info=exc)
+
+
+_MODE_STATUS: dict[Mode, bytes] = {
+    Mode.MISSING_SAFETY_KEY: encode_status_safety_key(),
+    Mode.ACTIVE: _STATUS_STARTED,
+    Mode.WARMUP: _STATUS_STARTED,
+    Mode.PAUSE: _STATUS_STOPPED,
+    Mode.SUMMARY: _STATUS_STOPPED,
+    Mode.IDLE: _STATUS_STOPPED,
+}
+
 
 @dataclass
 class DeviceInformation:
@@ -106,24 +169,76 @@ class FtmsBleRelay:
         """Initialize relay state and BLE characteristics."""
         self._client = client
         self._config = config
-        self._ranges = ranges or FtmsRanges()
-        self._loop = loop or asyncio.get_event_loop()
+        self._ranges = ranges or _DEFAULT_RANGES
+        # Resolved lazily in start() via get_running_loop() unless provided
+        self._loop: asyncio.AbstractEventLoop | None = loop
         self._server = BlessServer(name=config.name, name_overwrite=True)
         self._update_task: asyncio.Task[None] | None = None
-        self._status_value = bytearray(b"\x00")
-        self._control_point_value = bytearray(b"\x00")
+        self._tasks: set[asyncio.Task[None]] = set()
+        # Wakes the notify loop for an immediate out-of-cycle push
+        self._wake = asyncio.Event()
+        # Single worker so update_value calls stay ordered but never block
+        # the event loop on platforms with a synchronous BLE stack.
+        self._ble_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ftms-notify")
+        self._last_notify_ts = 0.0
+        self._last_treadmill_bytes = b""
+        # Canonical status kept as bytes so change detection compares without
+        # materializing a copy; the bytearray mirror is what bless holds and
+        # is refreshed by slice assignment so its identity never changes.
+        self._status_bytes: bytes = b"\x00"
+        self._status_value = bytearray(self._status_bytes)
+        # Stable response buffer; repacked in place for every indication
+        self._control_point_value = bytearray(CONTROL_POINT_RESPONSE_LEN)
+        # Stable buffer handed to bless once; refreshed in place each tick
         self._treadmill_value = bytearray(b"")
-        self._feature_value = bytearray(self._build_feature_value())
-        self._supported_speed_range = bytearray(encode_supported_speed_range(self._ranges))
-        self._supported_incline_range = bytearray(encode_supported_incline_range(self._ranges))
+        self._treadmill_scratch = bytearray(TREADMILL_DATA_MAX_LEN)
+        # Immutable payloads; bytearray views are built only where bless
+        # needs a mutable value.
+        self._feature_value: bytes = _FEATURE_VALUE
+        if self._ranges is _DEFAULT_RANGES:
+            self._supported_speed_range: bytes = _DEFAULT_SPEED_RANGE
+            self._supported_incline_range: bytes = _DEFAULT_INCLINE_RANGE
+        else:
+            self._supported_speed_range = encode_supported_speed_range(self._ranges)
+            self._supported_incline_range = encode_supported_incline_range(self._ranges)
         self._device_info = DeviceInformation()
+        # Static device-info payloads encoded once; the baseline GATT
+        # structure wraps them in bytearray only at registration time.
+        self._device_info_payloads: dict[str, bytes] = {
+            MANUFACTURER_NAME_UUID: self._device_info.manufacturer.encode("utf-8"),
+            MODEL_NUMBER_UUID: self._device_info.model.encode("utf-8"),
+            SERIAL_NUMBER_UUID: self._device_info.serial.encode("utf-8"),
+            FIRMWARE_REVISION_UUID: self._device_info.firmware.encode("utf-8"),
+            HARDWARE_REVISION_UUID: self._device_info.hardware.encode("utf-8"),
+            SOFTWARE_REVISION_UUID: self._device_info.software.encode("utf-8"),
+        }
+
+        # Characteristic handles, resolved once after GATT registration
+        self._char_treadmill: BaseGATTCharacteristic | None = None
+        self._char_status: BaseGATTCharacteristic | None = None
+        self._char_control_point: BaseGATTCharacteristic | None = None
+        self._char_speed_range: BaseGATTCharacteristic | None = None
+        self._char_incline_range: BaseGATTCharacteristic | None = None
+
+        # Last successfully read iFit values; reused when a read fails so
+        # subscribers keep receiving data instead of missing a tick. The iFit
+        # protocol has no per-field notifications, but the seven reads below
+        # already travel in a single WRITE_AND_READ round trip.
+        self._cached_values: dict[str, Any] = {}
+
+        # Raw FTMS-unit bounds for control point validation
+        self._speed_raw_bounds: tuple[int, int] = (0, 0)
+        self._incline_raw_bounds: tuple[int, int] = (0, 0)
+        self._refresh_raw_bounds()
 
         # Track last known target values for change detection
         self._last_target_speed: float | None = None
         self._last_target_incline: float | None = None
+        self._last_mode: object = None
 
-        # Control point handlers dispatch dictionary
-        self._control_handlers: dict[ControlPointOpcode, Callable[[int, bytes], None]] = {
+        # Control point handlers keyed by raw opcode; IntEnum members hash
+        # like their int values so no enum construction happens on lookup.
+        self._control_handlers: dict[int, Callable[[int, bytes], None]] = {
             ControlPointOpcode.REQUEST_CONTROL: self._handle_request_control,
             ControlPointOpcode.SET_TARGET_SPEED: self._handle_target_speed,
             ControlPointOpcode.SET_TARGET_INCLINE: self._handle_target_incline,
@@ -138,6 +253,8 @@ class FtmsBleRelay:
 
     async def start(self) -> None:
         """Start the BLE server and connect to the iFit equipment."""
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
         LOGGER.info("Connecting to iFit equipment...")
         await self._client.connect()
         LOGGER.info("Connected to iFit equipment")
@@ -167,6 +284,12 @@ class FtmsBleRelay:
             self._update_task.cancel()
             with contextlib.suppress(asyncio.CancelledError):
                 await self._update_task
+        if self._tasks:
+            for task in self._tasks:
+                task.cancel()
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+            self._tasks.clear()
+        self._ble_executor.shutdown(wait=True)
         await self._server.stop()
         await self._client.disconnect()
         LOGGER.info("FTMS server stopped")
@@ -205,6 +328,16 @@ class FtmsBleRelay:
         await self._server.add_gatt(gatt_structure)
         LOGGER.info("Added all GATT services and characteristics")
 
+        # Resolve characteristic handles once so notify paths avoid
+        # per-event UUID lookups in the server's service table.
+        self._char_treadmill = self._server.get_characteristic(TREADMILL_DATA_UUID)
+        self._char_status = self._server.get_characteristic(FITNESS_MACHINE_STATUS_UUID)
+        self._char_control_point = self._server.get_characteristic(
+            FITNESS_MACHINE_CONTROL_POINT_UUID
+        )
+        self._char_speed_range = self._server.get_characteristic(SUPPORTED_SPEED_RANGE_UUID)
+        self._char_incline_range = self._server.get_characteristic(SUPPORTED_INCLINE_RANGE_UUID)
+
         # Set up request handlers
         self._server.read_request_func = self._read_request
         self._server.write_request_func = self._write_request
@@ -226,7 +359,7 @@ class FtmsBleRelay:
                 APPEARANCE_UUID: {
                     "Properties": GATTCharacteristicProperties.read,
                     "Permissions": GATTAttributePermissions.readable,
-                    "Value": bytearray(APPEARANCE_TREADMILL.to_bytes(2, "little")),
+                    "Value": bytearray(_APPEARANCE_VALUE),
                 },
             },
             GATT_SERVICE_UUID: {
@@ -237,36 +370,12 @@ class FtmsBleRelay:
                 },
             },
             DEVICE_INFORMATION_SERVICE_UUID: {
-                MANUFACTURER_NAME_UUID: {
+                uuid: {
                     "Properties": GATTCharacteristicProperties.read,
                     "Permissions": GATTAttributePermissions.readable,
-                    "Value": bytearray(self._device_info.manufacturer.encode("utf-8")),
-                },
-                MODEL_NUMBER_UUID: {
-                    "Properties": GATTCharacteristicProperties.read,
-                    "Permissions": GATTAttributePermissions.readable,
-                    "Value": bytearray(self._device_info.model.encode("utf-8")),
-                },
-                SERIAL_NUMBER_UUID: {
-                    "Properties": GATTCharacteristicProperties.read,
-                    "Permissions": GATTAttributePermissions.readable,
-                    "Value": bytearray(self._device_info.serial.encode("utf-8")),
-                },
-                FIRMWARE_REVISION_UUID: {
-                    "Properties": GATTCharacteristicProperties.read,
-                    "Permissions": GATTAttributePermissions.readable,
-                    "Value": bytearray(self._device_info.firmware.encode("utf-8")),
-                },
-                HARDWARE_REVISION_UUID: {
-                    "Properties": GATTCharacteristicProperties.read,
-                    "Permissions": GATTAttributePermissions.readable,
-                    "Value": bytearray(self._device_info.hardware.encode("utf-8")),
-                },
-                SOFTWARE_REVISION_UUID: {
-                    "Properties": GATTCharacteristicProperties.read,
-                    "Permissions": GATTAttributePermissions.readable,
-                    "Value": bytearray(self._device_info.software.encode("utf-8")),
-                },
+                    "Value": bytearray(payload),
+                }
+                for uuid, payload in self._device_info_payloads.items()
             },
         }
 
@@ -281,17 +390,17 @@ class FtmsBleRelay:
                 FITNESS_MACHINE_FEATURE_UUID: {
                     "Properties": GATTCharacteristicProperties.read,
                     "Permissions": GATTAttributePermissions.readable,
-                    "Value": self._feature_value,
+                    "Value": bytearray(self._feature_value),
                 },
                 SUPPORTED_SPEED_RANGE_UUID: {
                     "Properties": GATTCharacteristicProperties.read,
                     "Permissions": GATTAttributePermissions.readable,
-                    "Value": self._supported_speed_range,
+                    "Value": bytearray(self._supported_speed_range),
                 },
                 SUPPORTED_INCLINE_RANGE_UUID: {
                     "Properties": GATTCharacteristicProperties.read,
                     "Permissions": GATTAttributePermissions.readable,
-                    "Value": self._supported_incline_range,
+                    "Value": bytearray(self._supported_incline_range),
                 },
                 TREADMILL_DATA_UUID: {
                     "Properties": GATTCharacteristicProperties.notify,
@@ -323,8 +432,10 @@ class FtmsBleRelay:
         Returns:
             The current value of the characteristic
         """
-        LOGGER.info("Read request on %s", characteristic.uuid)
-        return bytearray(characteristic.value)
+        LOGGER.debug("Read request on %s", characteristic.uuid)
+        # Bless only reads from the returned buffer, so hand back the
+        # characteristic's own bytearray instead of a fresh copy.
+        return characteristic.value
 
     def _write_request(
         self,
@@ -339,7 +450,6 @@ class FtmsBleRelay:
             value: The value being written
             **kwargs: Additional arguments from bless
         """
-        LOGGER.info("Write request on %s: %s", characteristic.uuid, value.hex())
         if characteristic.uuid != FITNESS_MACHINE_CONTROL_POINT_UUID:
             return
         if not value:
@@ -348,25 +458,19 @@ class FtmsBleRelay:
                 result=ControlPointResult.INVALID_PARAMETER,
             )
             return
+        LOGGER.debug("Write request on %s: %s", characteristic.uuid, _LazyHex(value))
 
         opcode = value[0]
-        try:
-            operation = ControlPointOpcode(opcode)
-            handler = self._control_handlers.get(operation)
-            if handler:
-                handler(opcode, value)
-            else:
-                LOGGER.warning("Unsupported control point opcode %s", operation.name)
-                self._send_control_point_response(
-                    opcode,
-                    result=ControlPointResult.OP_CODE_NOT_SUPPORTED,
-                )
-        except ValueError:
-            LOGGER.warning("Unknown control point opcode 0x%02x", opcode)
+        handler = self._control_handlers.get(opcode)
+        if handler is None:
+            LOGGER.warning("Unsupported control point opcode 0x%02x", opcode)
             self._send_control_point_response(
                 opcode,
                 result=ControlPointResult.OP_CODE_NOT_SUPPORTED,
             )
+            return
+        try:
+            handler(opcode, value)
         except Exception:  # pragma: no cover - defensive guard
             LOGGER.exception("Control point handling failed")
             self._send_control_point_response(
@@ -401,10 +505,9 @@ class FtmsBleRelay:
 
         # Send status notification
         status = encode_status_started()
-        self._status_value = bytearray(status)
-        self._notify_characteristic(
-            FTMS_SERVICE_UUID, FITNESS_MACHINE_STATUS_UUID, self._status_value
-        )
+        self._status_bytes = status
+        self._status_value[:] = status
+        self._notify_characteristic(self._char_status, self._status_value)
         LOGGER.info("Sent started notification")
 
     def _handle_stop_or_pause(self, opcode: int, value: bytes) -> None:
@@ -430,10 +533,9 @@ class FtmsBleRelay:
 
         # Send status notification
         status = encode_status_stopped()
-        self._status_value = bytearray(status)
-        self._notify_characteristic(
-            FTMS_SERVICE_UUID, FITNESS_MACHINE_STATUS_UUID, self._status_value
-        )
+        self._status_bytes = status
+        self._status_value[:] = status
+        self._notify_characteristic(self._char_status, self._status_value)
         LOGGER.info("Sent stopped notification")
 
     def _handle_target_value(
@@ -443,8 +545,7 @@ class FtmsBleRelay:
         *,
         is_signed: bool,
         scale: float,
-        min_val: float,
-        max_val: float,
+        raw_bounds: tuple[int, int],
         characteristic_name: str,
         unit: str,
     ) -> None:
@@ -455,8 +556,7 @@ class FtmsBleRelay:
             value: The full control point message
             is_signed: Whether the value is signed (incline) or unsigned (speed)
             scale: Scale factor to convert from FTMS units to actual units
-            min_val: Minimum allowed value
-            max_val: Maximum allowed value
+            raw_bounds: Allowed (min, max) bounds in raw FTMS units
             characteristic_name: Name of the iFit characteristic to write
             unit: Unit string for logging (e.g., "kph", "%")
         """
@@ -467,18 +567,20 @@ class FtmsBleRelay:
             )
             return
 
-        fmt = "<h" if is_signed else "<H"
-        (raw_value,) = unpack(fmt, value[1:3])
-        actual_value = raw_value / scale
+        parser = _S16_LE if is_signed else _U16_LE
+        (raw_value,) = parser.unpack_from(value, 1)
 
-        if not (min_val <= actual_value <= max_val):
+        # Validate on raw integers so values at the band edges are not
+        # rejected by floating-point rounding of the division.
+        min_raw, max_raw = raw_bounds
+        if not min_raw <= raw_value <= max_raw:
             LOGGER.warning(
                 "Target %s %.2f %s out of range [%.2f, %.2f], rejecting",
                 characteristic_name.lower(),
-                actual_value,
+                raw_value / scale,
                 unit,
-                min_val,
-                max_val,
+                min_raw / scale,
+                max_raw / scale,
             )
             self._send_control_point_response(
                 opcode,
@@ -486,6 +588,8 @@ class FtmsBleRelay:
             )
             return
 
+        actual_value = raw_value / scale
+
         LOGGER.info("Setting target %s to %.2f %s", characteristic_name.lower(), actual_value, unit)
         self._schedule_task(
             self._client.write_characteristics({characteristic_name: actual_value}),
@@ -505,8 +609,7 @@ class FtmsBleRelay:
             value,
             is_signed=False,
             scale=100.0,
-            min_val=self._ranges.min_kph,
-            max_val=self._ranges.max_kph,
+            raw_bounds=self._speed_raw_bounds,
             characteristic_name="Kph",
             unit="kph",
         )
@@ -523,29 +626,69 @@ class FtmsBleRelay:
             value,
             is_signed=True,
             scale=10.0,
-            min_val=self._ranges.min_incline,
-            max_val=self._ranges.max_incline,
+            raw_bounds=self._incline_raw_bounds,
             characteristic_name="Incline",
             unit="%",
         )
 
     def _notify_characteristic(
-        self, service_uuid: ServiceUUID, char_uuid: CharacteristicUUID, value: bytearray
+        self, characteristic: BaseGATTCharacteristic | None, value: bytearray
     ) -> None:
         """Update a characteristic value and send notification/indication.
 
         Args:
-            service_uuid: UUID of the service containing the characteristic
-            char_uuid: UUID of the characteristic to update
+            characteristic: Cached handle of the characteristic to update
             value: New value for the characteristic
         """
-        characteristic = self._server.get_characteristic(char_uuid)
-        if characteristic:
-            characteristic.value = value
-            self._server.update_value(service_uuid, char_uuid)
-            LOGGER.debug("Sent notification for %s (%d bytes)", char_uuid, len(value))
-        else:
-            LOGGER.error("Characteristic %s not found", char_uuid)
+        if characteristic is None:
+            LOGGER.error("Characteristic handle not resolved, cannot notify")
+            return
+        self._submit_update(characteristic, bytes(value))
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("Sent notification for %s (%d bytes)", characteristic.uuid, len(value))
+
+    def _notify_many(self, pairs: list[tuple[BaseGATTCharacteristic | None, bytearray]]) -> None:
+        """Send notifications for several characteristic values.
+
+        Every payload is snapshotted up front, so the batch reflects this
+        tick even when the staging buffers are rewritten in place before
+        the worker thread gets to them.
+
+        Args:
+            pairs: Characteristic handles with their new values
+        """
+        resolved = [(char, value) for char, value in pairs if char is not None]
+        if len(resolved) != len(pairs):
+            LOGGER.error("Characteristic handle not resolved, skipping notification")
+        debug = LOGGER.isEnabledFor(logging.DEBUG)
+        for characteristic, value in resolved:
+            self._submit_update(characteristic, bytes(value))
+            if debug:
+                LOGGER.debug("Sent notification for %s (%d bytes)", characteristic.uuid, len(value))
+
+    def _submit_update(self, characteristic: BaseGATTCharacteristic, value: bytes) -> None:
+        """Queue a characteristic push on the notify worker thread.
+
+        Args:
+            characteristic: Cached handle of the characteristic to update
+            value: Immutable snapshot of the payload to send
+        """
+        future = self._ble_executor.submit(self._push_value, characteristic, value)
+        future.add_done_callback(_log_update_failure)
+
+    def _push_value(self, characteristic: BaseGATTCharacteristic, value: bytes) -> None:
+        """Assign a snapshot and notify subscribers; runs on the worker thread.
+
+        The worker owns the value assignment so bless sends the payload
+        staged with this push, not whatever the event loop wrote into the
+        shared buffers afterwards.
+
+        Args:
+            characteristic: Characteristic to update
+            value: Immutable snapshot of the payload to send
+        """
+        characteristic.value = bytearray(value)
+        self._server.update_value(FTMS_SERVICE_UUID, characteristic.uuid)
 
     def _send_control_point_response(
         self,
@@ -559,18 +702,20 @@ class FtmsBleRelay:
             opcode: The original request opcode
             result: The result code to send
         """
-        payload = bytearray(encode_control_point_response(opcode, result))
-        self._control_point_value = payload
+        encode_control_point_response_into(self._control_point_value, opcode, result)
 
         # Send indication immediately. Per FTMS spec, clients must enable indications
         # before writing to control point, so we assume they're subscribed.
-        self._notify_characteristic(FTMS_SERVICE_UUID, FITNESS_MACHINE_CONTROL_POINT_UUID, payload)
+        self._notify_characteristic(self._char_control_point, self._control_point_value)
         LOGGER.debug("Sent control point indication: opcode=0x%02x, result=%s", opcode, result.name)
 
         # If this is REQUEST_CONTROL with success, send initial treadmill data
         # to help clients that wait for first notification before completing connection
         if opcode == ControlPointOpcode.REQUEST_CONTROL and result == ControlPointResult.SUCCESS:
-            self._schedule_task(self._update_treadmill_data(), "initial_data_update")
+            # Reset the dedupe so the push goes out even if the values are
+            # unchanged; a freshly subscribed client has not seen them yet.
+            self._last_treadmill_bytes = b""
+            self._wake.set()
 
     def _schedule_task(self, coro: Coroutine[object, object, None], label: str) -> None:
         """Schedule a background task and log failures.
@@ -580,8 +725,21 @@ class FtmsBleRelay:
             label: A descriptive label for logging
         """
         LOGGER.debug("Scheduling background task: %s", label)
-        task = self._loop.create_task(coro)
-        task.add_done_callback(lambda t: self._log_task_exception(t, label))
+        loop = self._loop or asyncio.get_running_loop()
+        # Carry the label as the task name so one bound callback serves all
+        # tasks without a closure allocation per call.
+        task = loop.create_task(coro, name=label)
+        self._tasks.add(task)
+        task.add_done_callback(self._on_task_done)
+
+    def _on_task_done(self, task: asyncio.Task[None]) -> None:
+        """Drop a finished task from the tracking set and log failures.
+
+        Args:
+            task: The completed task
+        """
+        self._tasks.discard(task)
+        self._log_task_exception(task, task.get_name())
 
     @staticmethod
     def _log_task_exception(task: asyncio.Future[None], label: str) -> None:
@@ -599,58 +757,124 @@ class FtmsBleRelay:
             LOGGER.error("Background task %s failed: %s", label, exc, exc_info=exc)
 
     async def _notify_loop(self) -> None:
-        """Continuously poll the iFit client and notify FTMS subscribers."""
+        """Continuously poll the iFit client and notify FTMS subscribers.
+
+        Runs against a monotonic deadline so the cadence stays at
+        update_interval even when the iFit read itself takes time, instead
+        of drifting by interval plus work time per iteration. Control point
+        handlers can set the wake event to trigger an immediate push;
+        wake-ups inside the coalesce window are merged into the last push
+        so overlapping writes do not double the notify traffic.
+        """
+        interval = self._config.update_interval
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
         while True:
+            next_tick += interval
+            self._wake.clear()
             await self._update_treadmill_data()
-            await asyncio.sleep(self._config.update_interval)
+            now = self._last_notify_ts = loop.time()
+            if now > next_tick + interval:
+                LOGGER.warning("Notify loop fell behind by %.2fs, resynchronizing", now - next_tick)
+                next_tick = now
+            while (delay := next_tick - loop.time()) > 0:
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=delay)
+                except TimeoutError:
+                    break
+                self._wake.clear()
+                if loop.time() - self._last_notify_ts >= _NOTIFY_COALESCE_WINDOW:
+                    # Immediate push requested; re-anchor the cadence on it
+                    next_tick = loop.time()
+                    break
 
     async def _update_treadmill_data(self) -> None:
-        """Read iFit values and update FTMS treadmill/status characteristics."""
+        """Read iFit values and update FTMS treadmill/status characteristics.
+
+        The equipment read is the expensive step of the loop (a full BLE
+        round trip), so it is skipped while no central is connected.
+        """
+        try:
+            if not await self._server.is_connected():
+                return
+        except Exception as e:  # noqa: BLE001  # Backend quirks; keep polling
+            LOGGER.debug("Connection check failed, polling anyway: %s", e)
         try:
             values = await self._client.read_characteristics(
                 ["CurrentKph", "Kph", "CurrentIncline", "Incline", "Distance", "Pulse", "Mode"]
             )
         except Exception as e:  # noqa: BLE001  # Catch all connection/read errors
             LOGGER.error("Failed to read iFit characteristics: %s", e)
-            return
+            if not self._cached_values:
+                return
+            values = self._cached_values
+        else:
+            self._cached_values = values
 
-        current_kph = float(values.get("CurrentKph", 0.0)) or float(values.get("Kph", 0.0))
-        current_incline = float(values.get("CurrentIncline", 0.0)) or float(
-            values.get("Incline", 0.0)
-        )
+        self._emit_treadmill_data(values)
+
+    def _emit_treadmill_data(self, values: dict[str, Any]) -> None:
+        """Encode iFit values and update FTMS treadmill/status characteristics.
+
+        Args:
+            values: iFit characteristic values, fresh or from the cache
+        """
+        # Resolve each key once; fall back to the target value only when the
+        # current reading is missing or zero.
         target_kph = float(values.get("Kph", 0.0))
         target_incline = float(values.get("Incline", 0.0))
+        current = values.get("CurrentKph")
+        current_kph = float(current) if current else target_kph
+        current = values.get("CurrentIncline")
+        current_incline = float(current) if current else target_incline
         distance = float(values.get("Distance", 0.0))
-        pulse_data = values.get("Pulse", {})
-        heart_rate = int(pulse_data.get("pulse", 0)) if isinstance(pulse_data, dict) else 0
+        pulse_data = values.get("Pulse")
+        heart_rate = (
+            int(pulse_data["pulse"])
+            if isinstance(pulse_data, dict) and pulse_data.get("pulse")
+            else 0
+        )
         mode = values.get("Mode")
 
-        LOGGER.debug(
-            "Treadmill data: speed=%.2f kph, incline=%.1f%%, distance=%.2f m, hr=%s, mode=%s",
-            current_kph,
-            current_incline,
-            distance,
-            heart_rate if heart_rate else "N/A",
-            mode,
-        )
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug(
+                "Treadmill data: speed=%.2f kph, incline=%.1f%%, distance=%.2f m, hr=%s, mode=%s",
+                current_kph,
+                current_incline,
+                distance,
+                heart_rate if heart_rate else "N/A",
+                mode,
+            )
 
         # Compose FTMS treadmill data with optional fields for incline/distance/hr.
-        self._treadmill_value = encode_treadmill_data(
+        # Pack into the scratch buffer, then slice-assign so bless keeps
+        # holding the same bytearray object across updates.
+        n = encode_treadmill_data_into(
+            self._treadmill_scratch,
             speed_kph=current_kph,
             incline_percent=current_incline,
             distance_m=distance,
             heart_rate_bpm=heart_rate if heart_rate else None,
         )
-
-        # Update and notify treadmill data
-        self._notify_characteristic(FTMS_SERVICE_UUID, TREADMILL_DATA_UUID, self._treadmill_value)
+        self._treadmill_value[:] = memoryview(self._treadmill_scratch)[:n]
+
+        # Group the treadmill update with a status change (if any) so both
+        # values are staged before the server round trips happen. Unchanged
+        # treadmill payloads are not re-notified.
+        pending: list[tuple[BaseGATTCharacteristic | None, bytearray]] = []
+        treadmill_bytes = bytes(self._treadmill_value)
+        if treadmill_bytes != self._last_treadmill_bytes:
+            self._last_treadmill_bytes = treadmill_bytes
+            pending.append((self._char_treadmill, self._treadmill_value))
+        status_value = self._update_status(mode)
+        if status_value is not None:
+            pending.append((self._char_status, status_value))
+        if pending:
+            self._notify_many(pending)
 
         # Check for target speed changes and send status notifications
         self._check_target_changes(target_kph, target_incline)
 
-        # Update status if mode changed
-        self._update_status(mode)
-
     def _check_target_changes(self, target_kph: float, target_incline: float) -> None:
         """Check for target speed/incline changes and send status notifications.
 
@@ -664,10 +888,9 @@ class FtmsBleRelay:
             and abs(target_kph - self._last_target_speed) > TARGET_CHANGE_THRESHOLD
         ):
             status = encode_status_target_speed_changed(target_kph)
-            self._status_value = bytearray(status)
-            self._notify_characteristic(
-                FTMS_SERVICE_UUID, FITNESS_MACHINE_STATUS_UUID, self._status_value
-            )
+            self._status_bytes = status
+            self._status_value[:] = status
+            self._notify_characteristic(self._char_status, self._status_value)
             LOGGER.info("Target speed changed: %.2f kph", target_kph)
 
         # Check target incline change
@@ -676,42 +899,38 @@ class FtmsBleRelay:
             and abs(target_incline - self._last_target_incline) > TARGET_CHANGE_THRESHOLD
         ):
             status = encode_status_target_incline_changed(target_incline)
-            self._status_value = bytearray(status)
-            self._notify_characteristic(
-                FTMS_SERVICE_UUID, FITNESS_MACHINE_STATUS_UUID, self._status_value
-            )
+            self._status_bytes = status
+            self._status_value[:] = status
+            self._notify_characteristic(self._char_status, self._status_value)
             LOGGER.info("Target incline changed: %.2f %%", target_incline)
 
         # Update tracked values
         self._last_target_speed = target_kph
         self._last_target_incline = target_incline
 
-    def _update_status(self, mode: object) -> None:
+    def _update_status(self, mode: object) -> bytearray | None:
         """Update fitness machine status based on mode.
 
         Args:
             mode: The current iFit mode
+
+        Returns:
+            The new status value to notify, or None when unchanged
         """
-        status = self._encode_status_from_mode(mode)
-        if not status or status == bytes(self._status_value):
-            return
+        # Mode rarely changes; enum members are singletons so the identity
+        # check skips the encode and byte compare on steady-state ticks.
+        if mode is self._last_mode:
+            return None
+        self._last_mode = mode
 
-        self._status_value = bytearray(status)
-        self._notify_characteristic(
-            FTMS_SERVICE_UUID, FITNESS_MACHINE_STATUS_UUID, self._status_value
-        )
-        LOGGER.info("Sent status notification: mode=%s", mode)
+        status = self._encode_status_from_mode(mode)
+        if not status or status == self._status_bytes:
+            return None
 
-    @staticmethod
-    def _build_feature_value() -> bytes:
-        """Build the FTMS feature bitfield payload."""
-        return encode_fitness_machine_feature(
-            supports_inclination=True,
-            supports_heart_rate=True,
-            supports_total_distance=True,
-            supports_speed_target=True,
-            supports_incline_target=True,
-        )
+        self._status_bytes = status
+        self._status_value[:] = status
+        LOGGER.info("Status changed: mode=%s", mode)
+        return self._status_value
 
     def _update_ranges_from_equipment(self) -> None:
         """Update supported ranges based on the iFit equipment metadata."""
@@ -723,7 +942,7 @@ class FtmsBleRelay:
         max_kph = float(info.values.get("MaxKph", self._ranges.max_kph))
         min_incline = float(info.values.get("MinIncline", self._ranges.min_incline))
         max_incline = float(info.values.get("MaxIncline", self._ranges.max_incline))
-        self._ranges = FtmsRanges(
+        new_ranges = FtmsRanges(
             min_kph=min_kph,
             max_kph=max_kph,
             min_incline=min_incline,
@@ -731,6 +950,10 @@ class FtmsBleRelay:
             speed_increment=self._ranges.speed_increment,
             incline_increment=self._ranges.incline_increment,
         )
+        if new_ranges == self._ranges:
+            LOGGER.debug("Equipment ranges match current configuration, keeping encoded payloads")
+            return
+        self._ranges = new_ranges
         LOGGER.info(
             "Updated ranges from equipment: speed=%.1f-%.1f kph, incline=%.1f-%.1f%%",
             min_kph,
@@ -738,27 +961,30 @@ class FtmsBleRelay:
             min_incline,
             max_incline,
         )
-        self._supported_speed_range = bytearray(encode_supported_speed_range(self._ranges))
-        self._supported_incline_range = bytearray(encode_supported_incline_range(self._ranges))
+        self._supported_speed_range = encode_supported_speed_range(self._ranges)
+        self._supported_incline_range = encode_supported_incline_range(self._ranges)
+        self._refresh_raw_bounds()
+
+    def _refresh_raw_bounds(self) -> None:
+        """Recompute control point bounds in raw FTMS integer units."""
+        self._speed_raw_bounds = (
+            round(self._ranges.min_kph * 100),
+            round(self._ranges.max_kph * 100),
+        )
+        self._incline_raw_bounds = (
+            round(self._ranges.min_incline * 10),
+            round(self._ranges.max_incline * 10),
+        )
 
     def _update_range_characteristics(self) -> None:
         """Update range characteristic values after GATT initialization."""
-        speed_range_char = self._server.get_characteristic(SUPPORTED_SPEED_RANGE_UUID)
-        if speed_range_char is not None:
-            speed_range_char.value = self._supported_speed_range
+        if self._char_speed_range is not None:
+            self._char_speed_range.value = bytearray(self._supported_speed_range)
 
-        incline_range_char = self._server.get_characteristic(SUPPORTED_INCLINE_RANGE_UUID)
-        if incline_range_char is not None:
-            incline_range_char.value = self._supported_incline_range
+        if self._char_incline_range is not None:
+            self._char_incline_range.value = bytearray(self._supported_incline_range)
 
     @staticmethod
     def _encode_status_from_mode(mode: object) -> bytes | None:
         """Map iFit mode values to FTMS status messages."""
-        if isinstance(mode, Mode):
-            if mode == Mode.MISSING_SAFETY_KEY:
-                return encode_status_safety_key()
-            if mode in {Mode.ACTIVE, Mode.WARMUP}:
-                return encode_status_started()
-            if mode in {Mode.PAUSE, Mode.SUMMARY, Mode.IDLE}:
-                return encode_status_stopped()
-        return None
+        return _MODE_STATUS.get(mode) if isinstance(mode, Mode) else None
@@ -16,6 +16,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import sys
+from collections.abc import Callable
 from typing import TYPE_CHECKING, Self, TypeAlias
 
 from .._scanner import find_ifit_device
@@ -29,6 +30,10 @@ if TYPE_CHECKING:
         GATTCharacteristicProperties,
     )
 
+    # What BlessServer.get_characteristic actually returns, as opposed to
+    # the platform alias exported at bless top level
+    from bless.backends.characteristic import BlessGATTCharacteristic as BaseGATTCharacteristic
+
 from ..client.protocol import (
     BLE_UUIDS,
     Command,
@@ -57,6 +62,12 @@ LOGGER = logging.getLogger(__name__)
 CharacteristicUUID: TypeAlias = str
 ServiceUUID: TypeAlias = str
 
+# iFit proxy UUIDs resolved once; hot paths compare against these locals
+# instead of re-indexing BLE_UUIDS per packet
+_SERVICE_UUID = BLE_UUIDS["service"]
+_TX_UUID = BLE_UUIDS["tx"]
+_RX_UUID = BLE_UUIDS["rx"]
+
 # Standard UUIDs as constants
 GAP_SERVICE_UUID = "00001800-0000-1000-8000-00805f9b34fb"
 GATT_SERVICE_UUID = "00001801-0000-1000-8000-00805f9b34fb"
@@ -102,11 +113,25 @@ class ActivationCodeDiscovery:
 
         self.server: BlessServer | None = None
         self.treadmill_client: BleakClient | None = None
+        # Resolved once after the GATT structure is registered
+        self._rx_char: BaseGATTCharacteristic | None = None
         self.activation_code: str | None = None
 
+        # Set when the Enable command carrying the activation code arrives
+        self._captured = asyncio.Event()
+
+        # Fragment handlers keyed by framing index; continuations are the
+        # dispatch default
+        self._frag_handlers: dict[int, Callable[[memoryview], None]] = {
+            HEADER_INDEX: self._handle_header,
+            FIRST_PART_INDEX: self._handle_first_part,
+            EOF_INDEX: self._handle_eof,
+        }
+
         # State for request/response handling
         self._current_request_buffer: bytearray | None = None
         self._current_request_length: int = -1
+        self._buf_pos: int = 0
         self._current_command: int | None = None
         self._current_device: int = SportsEquipment.GENERAL
 
@@ -176,9 +201,12 @@ class ActivationCodeDiscovery:
         print("\nWaiting for activation code...")
         print("(The app will send it during the Enable command)\n")
 
-        # Step 3: Wait for activation code
+        # Step 3: Wait for activation code. asyncio.timeout cancels this
+        # task directly via loop.call_at instead of spawning a wrapper task
+        # the way wait_for does.
         try:
-            await asyncio.wait_for(self._wait_for_activation_code(), timeout=timeout)
+            async with asyncio.timeout(timeout):
+                await self._wait_for_activation_code()
         except TimeoutError as e:
             raise TimeoutError(
                 f"Activation code not received within {timeout}s. "
@@ -190,6 +218,7 @@ class ActivationCodeDiscovery:
 
         print(f"\n{'=' * 50}")
         print(f"✓ Activation code captured: {self.activation_code}")
+        print("  You can now close the manufacturer's app.")
         print(f"{'=' * 50}\n")
         print("You can now use this activation code with:")
         print(f"  ifit <command> {self.treadmill_address} {self.activation_code}")
@@ -298,7 +327,7 @@ class ActivationCodeDiscovery:
 
         try:
             await self.treadmill_client.start_notify(
-                BLE_UUIDS["rx"],
+                _RX_UUID,
                 self._handle_treadmill_notify,  # type: ignore[arg-type]
             )
             LOGGER.debug("Enabled notifications on treadmill RX characteristic")
@@ -317,8 +346,8 @@ class ActivationCodeDiscovery:
             Dictionary mapping service UUID to characteristics configuration
         """
         return {
-            BLE_UUIDS["service"]: {
-                BLE_UUIDS["tx"]: {
+            _SERVICE_UUID: {
+                _TX_UUID: {
                     "Properties": (
                         GATTCharacteristicProperties.write
                         | GATTCharacteristicProperties.write_without_response
@@ -326,7 +355,7 @@ class ActivationCodeDiscovery:
                     "Permissions": GATTAttributePermissions.writeable,
                     "Value": bytearray(),
                 },
-                BLE_UUIDS["rx"]: {
+                _RX_UUID: {
                     "Properties": GATTCharacteristicProperties.notify,
                     "Permissions": GATTAttributePermissions.readable,
                     "Value": bytearray(),
@@ -424,7 +453,7 @@ class ActivationCodeDiscovery:
             LOGGER.debug("CoreBluetooth advertisement configuration failed: %s", e)
             return False
 
-    async def _configure_bluez_advertisement(self) -> bool:  # noqa: PLR0911
+    async def _configure_bluez_advertisement(self) -> bool:
         """Configure advertisement using BlueZ on Linux.
 
         Returns:
@@ -455,25 +484,21 @@ class ActivationCodeDiscovery:
             # The format should be: {company_id: [byte, byte, ...]}
             # Use the captured company ID or fallback
             company_id = self._manufacturer_company_id or 0xFFFF
+            mdata = {company_id: list(self._manufacturer_data)}
 
             if hasattr(adv, "manufacturer_data"):
                 # Set as a dict with company ID as key
-                adv.manufacturer_data = {company_id: list(self._manufacturer_data)}
-                LOGGER.info(
-                    "Successfully configured BlueZ manufacturer data with company ID 0x%04X",
-                    company_id,
-                )
-                return True
-            if hasattr(adv, "ManufacturerData"):
+                adv.manufacturer_data = mdata
+            elif hasattr(adv, "ManufacturerData"):
                 # Alternative property name
-                adv.ManufacturerData = {company_id: list(self._manufacturer_data)}
-                LOGGER.info(
-                    "Successfully configured BlueZ manufacturer data with company ID 0x%04X",
-                    company_id,
-                )
-                return True
-
-            return False
+                adv.ManufacturerData = mdata
+            else:
+                return False
+            LOGGER.info(
+                "Successfully configured BlueZ manufacturer data with company ID 0x%04X",
+                company_id,
+            )
+            return True
 
         except Exception as e:
             LOGGER.debug("BlueZ advertisement configuration failed: %s", e)
@@ -499,6 +524,7 @@ class ActivationCodeDiscovery:
             # Build and add GATT structure
             gatt_structure = self._build_gatt_structure()
             await self.server.add_gatt(gatt_structure)
+            self._rx_char = self.server.get_characteristic(_RX_UUID)
             LOGGER.debug("Added iFit service and characteristics")
 
             # Set write request handler
@@ -508,7 +534,8 @@ class ActivationCodeDiscovery:
             # Configure advertisement with manufacturer data AFTER server starts
             # This ensures the GATT server is running before we add the auxiliary advertiser
             await self._configure_advertisement()
-            await asyncio.sleep(60)  # Ensure advertisement is set up before starting server
+            # Brief settle delay for the advertisement registration
+            await asyncio.sleep(0.1)
             LOGGER.debug("Advertisement configured, starting server...")
             # Start server and begin advertising
             await self.server.start()
@@ -534,71 +561,104 @@ class ActivationCodeDiscovery:
             value: The data written by the app
             **kwargs: Additional arguments from bless
         """
-        LOGGER.debug("App wrote to %s: %s", characteristic.uuid, value.hex())
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("App wrote to %s: %s", characteristic.uuid, value.hex())
 
-        if characteristic.uuid != BLE_UUIDS["tx"]:
+        if characteristic.uuid != _TX_UUID:
             LOGGER.warning("Unexpected write to characteristic %s", characteristic.uuid)
             return
 
         try:
-            buffer = bytearray(value)
-            self._process_message_fragment(buffer)
+            # Zero-copy view; fragment slices extend the accumulator without
+            # materializing intermediate bytes objects.
+            self._process_message_fragment(memoryview(value))
 
             # Check if message is complete
-            if self._is_complete_message(buffer[0], len(buffer)):
+            if self._is_complete_message(value[0], len(value)):
                 await self._process_complete_request()
         except Exception as e:
             LOGGER.exception("Failed to process app write: %s", e)
 
-    def _process_message_fragment(self, buffer: bytearray) -> None:
+    def _process_message_fragment(self, buffer: memoryview) -> None:
         """Process a single BLE message fragment.
 
-        Handles different message types: headers, first parts, continuations,
-        and accumulates payload data for reassembly.
+        Dispatches on the framing index: headers, first parts, and EOF
+        markers have dedicated handlers, everything else is a continuation.
+
+        Args:
+            buffer: Message fragment data
+        """
+        self._frag_handlers.get(buffer[0], self._handle_continuation)(buffer)
+
+    def _handle_header(self, buffer: memoryview) -> None:
+        """Start a new request from a header fragment.
 
         Args:
             buffer: Message fragment data
         """
-        index = buffer[0]
+        self._current_request_length = buffer[2]
+        # Pre-size to the announced length so fragment appends never
+        # reallocate; slice assignment grows it if the header lied.
+        self._current_request_buffer = bytearray(self._current_request_length)
+        self._buf_pos = 0
+        LOGGER.debug("Received header, expecting %d bytes", self._current_request_length)
+
+    def _handle_first_part(self, buffer: memoryview) -> None:
+        """Record command/device info and payload from a first-part fragment.
 
-        # Parse message framing
-        if index == HEADER_INDEX:
-            self._current_request_length = buffer[2]
+        Args:
+            buffer: Message fragment data
+        """
+        self._current_command = buffer[COMMAND_OFFSET]
+        self._current_device = buffer[DEVICE_OFFSET]
+        # Extract payload from first part
+        content_length = buffer[1]
+        content = buffer[FIRST_PART_CONTENT_START : FIRST_PART_CONTENT_START + content_length]
+        if self._current_request_buffer is None:
             self._current_request_buffer = bytearray()
-            LOGGER.debug("Received header, expecting %d bytes", self._current_request_length)
-            return
+            self._buf_pos = 0
+        self._append_content(content)
+        LOGGER.debug(
+            "First part: cmd=0x%02x, device=%d, content=%d bytes",
+            self._current_command,
+            self._current_device,
+            content_length,
+        )
+
+    def _handle_eof(self, buffer: memoryview) -> None:
+        """Pick the command off an EOF marker when not previously set.
 
-        if index == FIRST_PART_INDEX:
-            # First part contains command and device info
+        Args:
+            buffer: Message fragment data
+        """
+        if not self._current_command and len(buffer) > COMMAND_OFFSET:
             self._current_command = buffer[COMMAND_OFFSET]
-            self._current_device = buffer[DEVICE_OFFSET]
-            # Extract payload from first part
-            content_length = buffer[1]
-            content = buffer[FIRST_PART_CONTENT_START : FIRST_PART_CONTENT_START + content_length]
-            if self._current_request_buffer is None:
-                self._current_request_buffer = bytearray()
-            self._current_request_buffer.extend(content)
-            LOGGER.debug(
-                "First part: cmd=0x%02x, device=%d, content=%d bytes",
-                self._current_command,
-                self._current_device,
-                content_length,
-            )
-        elif index == EOF_INDEX:
-            # EOF marker may contain command if not previously set
-            if not self._current_command and len(buffer) > COMMAND_OFFSET:
-                self._current_command = buffer[COMMAND_OFFSET]
-        else:
-            # Continuation message
-            if self._current_request_buffer is None:
-                LOGGER.warning("Continuation message without header, discarding")
-                return
-            content_length = buffer[1]
-            content = buffer[
-                CONTINUATION_CONTENT_START : CONTINUATION_CONTENT_START + content_length
-            ]
-            self._current_request_buffer.extend(content)
-            LOGGER.debug("Continuation: %d bytes", content_length)
+
+    def _handle_continuation(self, buffer: memoryview) -> None:
+        """Append payload from a continuation fragment.
+
+        Args:
+            buffer: Message fragment data
+        """
+        if self._current_request_buffer is None:
+            LOGGER.warning("Continuation message without header, discarding")
+            return
+        content_length = buffer[1]
+        content = buffer[CONTINUATION_CONTENT_START : CONTINUATION_CONTENT_START + content_length]
+        self._append_content(content)
+        LOGGER.debug("Continuation: %d bytes", content_length)
+
+    def _append_content(self, content: memoryview) -> None:
+        """Append fragment content at the current write offset.
+
+        Args:
+            content: Payload slice from the incoming fragment
+        """
+        if self._current_request_buffer is None:  # pragma: no cover - guarded by callers
+            return
+        end = self._buf_pos + len(content)
+        self._current_request_buffer[self._buf_pos : end] = content
+        self._buf_pos = end
 
     def _is_complete_message(self, index: int, length: int) -> bool:
         """Check if we have received a complete message.
@@ -629,7 +689,11 @@ class ActivationCodeDiscovery:
             self._reset_request_state()
             return
 
-        payload = bytes(self._current_request_buffer) if self._current_request_buffer else b""
+        payload = (
+            bytes(memoryview(self._current_request_buffer)[: self._buf_pos])
+            if self._current_request_buffer
+            else b""
+        )
 
         LOGGER.info(
             "Processing complete request: cmd=0x%02x, device=%d, payload=%d bytes",
@@ -641,9 +705,7 @@ class ActivationCodeDiscovery:
         # Check if this is the Enable command and capture activation code
         if self._current_command == Command.ENABLE:
             self.activation_code = payload.hex()
-            print(f"\n✓ Captured activation code: {self.activation_code}")
-            print("\nYou can now close the manufacturer's app.")
-            print("Discovery will complete shortly...\n")
+            self._captured.set()
             LOGGER.info("Activation code captured: %s", self.activation_code)
 
         # Forward request to real treadmill
@@ -658,6 +720,7 @@ class ActivationCodeDiscovery:
     def _reset_request_state(self) -> None:
         """Reset request parsing state for next message."""
         self._current_request_buffer = None
+        self._buf_pos = 0
         self._current_command = None
         self._current_device = SportsEquipment.GENERAL
 
@@ -677,11 +740,15 @@ class ActivationCodeDiscovery:
             raise RuntimeError("Treadmill client not connected")
 
         try:
-            chunks = list(build_write_messages(request))
-            LOGGER.debug("Forwarding request to treadmill: %d chunks", len(chunks))
+            chunks = tuple(build_write_messages(request))
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                LOGGER.debug("Forwarding request to treadmill: %d chunks", len(chunks))
+            # Chunks carry sequential framing indices, so they must arrive
+            # in order; keep the writes serial rather than gathering them.
             for chunk in chunks:
-                await self.treadmill_client.write_gatt_char(BLE_UUIDS["tx"], chunk, response=False)
-            LOGGER.debug("Successfully forwarded %d-byte request", len(request))
+                await self.treadmill_client.write_gatt_char(_TX_UUID, chunk, response=False)
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                LOGGER.debug("Successfully forwarded %d-byte request", len(request))
         except Exception as e:
             LOGGER.error("Failed to forward request to treadmill: %s", e)
             raise
@@ -700,10 +767,15 @@ class ActivationCodeDiscovery:
             LOGGER.warning("Server not initialized, cannot send notification")
             return
 
-        characteristic = self.server.get_characteristic(char_uuid)
+        # The rx characteristic handles every treadmill notification; use
+        # the cached handle and fall back to a lookup for anything else.
+        if char_uuid == _RX_UUID and self._rx_char is not None:
+            characteristic = self._rx_char
+        else:
+            characteristic = self.server.get_characteristic(char_uuid)
         if characteristic:
             characteristic.value = bytearray(value)
-            self.server.update_value(BLE_UUIDS["service"], char_uuid)
+            self.server.update_value(_SERVICE_UUID, char_uuid)
             LOGGER.debug(
                 "Sent notification to app on %s (%d bytes)",
                 char_uuid,
@@ -722,13 +794,13 @@ class ActivationCodeDiscovery:
             _sender: BLE sender identifier (unused)
             data: Response data from treadmill
         """
-        LOGGER.debug("Treadmill notified: %s", data.hex())
-        self._notify_app(BLE_UUIDS["rx"], data)
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("Treadmill notified: %s", data.hex())
+        self._notify_app(_RX_UUID, data)
 
     async def _wait_for_activation_code(self) -> None:
         """Wait until activation code is captured."""
-        while not self.activation_code:
-            await asyncio.sleep(0.5)
+        await self._captured.wait()
 
     async def cleanup(self) -> None:
         """Clean up BLE resources.
@@ -3,7 +3,9 @@
 
 This script connects to an iFit device and reads all characteristics that don't have
 a known converter (Unknown_* characteristics). It reads them one at a time to discover
-their data length and content, which is logged for later analysis.
+their data length and content, which is logged for later analysis. Single-characteristic
+reads are required here: response parsing can only infer the length of an unknown
+characteristic when it is alone in the response.
 
 Usage:
     python scripts/discover_unknown_characteristics.py <device_address>
@@ -20,11 +22,12 @@ from pathlib import Path
 # Add parent directory to path so we can import ifit
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from ifit.client import IFitBleClient
-
 
 async def discover_unknown_characteristics(address: str):
     """Connect to device and read all unknown characteristics."""
+    # Deferred so usage errors print without paying the bleak import chain
+    from ifit.client import IFitBleClient  # noqa: PLC0415
+
     print(f"\nConnecting to {address}...")
 
     client = IFitBleClient(address)
@@ -44,19 +47,23 @@ async def discover_unknown_characteristics(address: str):
         print(f"\nEquipment type: {info.equipment.name}")
         print(f"Total characteristics: {len(info.characteristics)}")
 
-        # Find all unknown characteristics (those with converter=None)
-        unknown_chars = [
-            char
-            for char in info.characteristics.values()
-            if char.converter is None and char.name.startswith("Unknown_")
-        ]
+        # Find all unknown characteristics (those with converter=None),
+        # sorted once for both the preview and the read loop
+        unknown_chars = sorted(
+            (
+                char
+                for char in info.characteristics.values()
+                if char.converter is None and char.name.startswith("Unknown_")
+            ),
+            key=lambda c: c.id,
+        )
 
         if not unknown_chars:
             print("\n[OK] No unknown characteristics found - all are documented!")
             return
 
         print(f"\nFound {len(unknown_chars)} unknown characteristics:")
-        for char in sorted(unknown_chars, key=lambda c: c.id):
+        for char in unknown_chars:
             print(f"  - {char.name} (ID={char.id})")
 
         print("\n" + "=" * 80)
@@ -67,7 +74,7 @@ async def discover_unknown_characteristics(address: str):
         success_count = 0
         failed_count = 0
 
-        for char in sorted(unknown_chars, key=lambda c: c.id):
+        for char in unknown_chars:
             print(f"\nReading {char.name} (ID={char.id})...")
             try:
                 # Read this single characteristic
@@ -85,9 +92,6 @@ async def discover_unknown_characteristics(address: str):
                 print(f"  [-] Error: {e}")
                 failed_count += 1
 
-            # Small delay between reads
-            await asyncio.sleep(0.2)
-
         print("\n" + "=" * 80)
         print(f"Discovery complete: {success_count} successful, {failed_count} failed")
         print("=" * 80)
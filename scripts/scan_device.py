@@ -16,9 +16,7 @@ async def scan_device_services(address: str):
         print(f"   Is connected: {client.is_connected}")
         print(f"   MTU size: {client.mtu_size}")
 
-        # Wait a bit for services to be discovered
-        await asyncio.sleep(2)
-
+        # bleak's connect() already waits for service discovery to finish
         print("\nDiscovering services and characteristics...\n")
         print("=" * 80)
 
@@ -29,19 +27,34 @@ async def scan_device_services(address: str):
             print(f"\n📦 Service: {service.uuid}")
             print(f"   Description: {service.description}")
 
+            # Device Information values are static, so the OS cache is safe
+            # there and much faster on backends that honor use_cached; all
+            # other services are probed fresh (the default).
+            use_cached = service.uuid.startswith("0000180a")
+
+            # Issue all reads for this service concurrently so the wall time
+            # is one round of connection intervals instead of one per char
+            readable = [c for c in service.characteristics if "read" in c.properties]
+            values = await asyncio.gather(
+                *(client.read_gatt_char(c.uuid, use_cached=use_cached) for c in readable),
+                return_exceptions=True,
+            )
+            value_by_handle = {c.handle: v for c, v in zip(readable, values, strict=True)}
+
             for char in service.characteristics:
                 props = ", ".join(char.properties)
-                print(f"   📄 Characteristic: {char.uuid}")
-                print(f"      Properties: {props}")
-                print(f"      Handle: {char.handle}")
-
-                # Try to read if readable
-                if "read" in char.properties:
-                    try:
-                        value = await client.read_gatt_char(char.uuid)
-                        print(f"      Value: {value.hex()}")
-                    except Exception as e:
-                        print(f"      Value: (read failed: {e})")
+                # One write per characteristic instead of a print per line
+                report = (
+                    f"   📄 Characteristic: {char.uuid}\n"
+                    f"      Properties: {props}\n"
+                    f"      Handle: {char.handle}"
+                )
+                value = value_by_handle.get(char.handle)
+                if isinstance(value, BaseException):
+                    report += f"\n      Value: (read failed: {value})"
+                elif value is not None:
+                    report += f"\n      Value: {value.hex()}"
+                print(report)
 
         print("\n" + "=" * 80)
 
@@ -55,20 +68,26 @@ async def find_and_scan(ble_code: str):
     print(f"Scanning for device with BLE code '{ble_code}'...")
     print(f"Looking for manufacturer data ending with: {suffix.hex()}")
 
-    devices = await BleakScanner.discover(timeout=10.0, return_adv=True)
-
-    for device, adv_data in devices.values():
-        if not adv_data.manufacturer_data:
-            continue
+    matched_payload: list[bytes] = []
 
+    def _match(_device, adv_data) -> bool:
         for payload in adv_data.manufacturer_data.values():
             if payload.endswith(suffix):
-                print(f"\n[OK] Found: {device.name} at {device.address}")
-                print(f"   Manufacturer data: {payload.hex()}")
-                await scan_device_services(device.address)
-                return
+                matched_payload.append(payload)
+                return True
+        return False
+
+    # Stops at the first matching advertisement instead of always waiting
+    # out the full scan window
+    device = await BleakScanner.find_device_by_filter(_match, timeout=10.0)
+
+    if device is None:
+        print(f"\n[X] No device found with BLE code '{ble_code}'")
+        return
 
-    print(f"\n[X] No device found with BLE code '{ble_code}'")
+    print(f"\n[OK] Found: {device.name} at {device.address}")
+    print(f"   Manufacturer data: {matched_payload[0].hex()}")
+    await scan_device_services(device.address)
 
 
 if __name__ == "__main__":